@@ -0,0 +1,64 @@
+"""Baseline schema as created by the original create_all
+
+Existing deployments already have these tables; mark them with
+`alembic stamp 0000_baseline` before running `alembic upgrade head`.
+
+Revision ID: 0000_baseline
+Revises:
+Create Date: 2026-10-14
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0000_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("profile_picture", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "posts",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("excerpt", sa.String(), nullable=True),
+        sa.Column("category", sa.String(), nullable=True),
+        sa.Column("author_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"], name="posts_author_id_fkey"),
+    )
+    op.create_index("ix_posts_id", "posts", ["id"])
+
+    op.create_table(
+        "comments",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("post_id", sa.String(), nullable=False),
+        sa.Column("author_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["post_id"], ["posts.id"], name="comments_post_id_fkey"),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"], name="comments_author_id_fkey"),
+    )
+    op.create_index("ix_comments_id", "comments", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("comments")
+    op.drop_table("posts")
+    op.drop_table("users")
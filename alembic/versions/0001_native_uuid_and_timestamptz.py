@@ -0,0 +1,76 @@
+"""Native UUID keys and server-side TIMESTAMPTZ defaults
+
+Ids move from text to uuid (16 bytes, integer comparison) and timestamps
+from naive UTC `timestamp` to `timestamptz` defaulting to now().
+
+Revision ID: 0001_native_uuid_and_timestamptz
+Revises: 0000_baseline
+Create Date: 2026-10-14
+"""
+from alembic import op
+
+
+revision = "0001_native_uuid_and_timestamptz"
+down_revision = "0000_baseline"
+branch_labels = None
+depends_on = None
+
+# Foreign keys must be dropped while the referenced columns change type
+FOREIGN_KEYS = [
+    ("posts_author_id_fkey", "posts", "author_id", "users"),
+    ("comments_post_id_fkey", "comments", "post_id", "posts"),
+    ("comments_author_id_fkey", "comments", "author_id", "users"),
+]
+
+ID_COLUMNS = {
+    "users": ["id"],
+    "posts": ["id", "author_id"],
+    "comments": ["id", "post_id", "author_id"],
+}
+
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at"],
+    "posts": ["created_at", "updated_at"],
+    "comments": ["created_at", "updated_at"],
+}
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referent in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, [column], ["id"])
+
+
+def upgrade() -> None:
+    _drop_foreign_keys()
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid")
+    _create_foreign_keys()
+
+    # Stored values came from datetime.utcnow(), so they are UTC wall-clock times
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamptz "
+                f"USING {column} AT TIME ZONE 'UTC', ALTER COLUMN {column} SET DEFAULT now()"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT, "
+                f"ALTER COLUMN {column} TYPE timestamp USING {column} AT TIME ZONE 'UTC'"
+            )
+
+    _drop_foreign_keys()
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar USING {column}::text")
+    _create_foreign_keys()
@@ -0,0 +1,29 @@
+"""Indexes for the list endpoints and case-insensitive email lookup
+
+Revision ID: 0002_query_indexes
+Revises: 0001_native_uuid_and_timestamptz
+Create Date: 2026-10-14
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_query_indexes"
+down_revision = "0001_native_uuid_and_timestamptz"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_posts_created_at", "posts", [sa.text("created_at DESC")])
+    op.create_index("ix_posts_author_created", "posts", ["author_id", sa.text("created_at DESC")])
+    op.create_index("ix_comments_post_created", "comments", ["post_id", sa.text("created_at DESC")])
+    # Fails if existing emails differ only in case; merge those accounts first
+    op.create_index("ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.drop_index("ix_comments_post_created", table_name="comments")
+    op.drop_index("ix_posts_author_created", table_name="posts")
+    op.drop_index("ix_posts_created_at", table_name="posts")
@@ -0,0 +1,30 @@
+"""Track profile edits on users
+
+The post list ETag includes max(users.updated_at), so author name and
+picture changes produce a new ETag.
+
+Revision ID: 0003_users_updated_at
+Revises: 0002_query_indexes
+Create Date: 2026-10-14
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_users_updated_at"
+down_revision = "0002_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    # Existing profiles have not been edited since they were created
+    op.execute("UPDATE users SET updated_at = created_at WHERE created_at IS NOT NULL")
+
+
+def downgrade() -> None:
+    op.drop_column("users", "updated_at")
@@ -1,13 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from src.routes import auth, posts, comments, users
 from src.database.database import engine, Base
+from src.database.cache import redis_client
 from src.config.settings import settings
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables on startup and release connections on shutdown"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+    if redis_client is not None:
+        await redis_client.aclose()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -15,7 +26,9 @@ app = FastAPI(
     description="A comprehensive RESTful API for a blog application with user authentication, posts, and comments",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -78,5 +91,18 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", 8000)),
+        # Async workers need about one per core; capped so the default
+        # pools (DB_POOL_SIZE + DB_MAX_OVERFLOW each) fit max_connections=100
+        workers=int(os.getenv("WEB_CONCURRENCY", min(os.cpu_count() or 1, 8))),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
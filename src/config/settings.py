@@ -5,12 +5,27 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Per worker; the defaults keep 8 workers within Postgres' default 100 connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
     
+    # Password hashing
+    BCRYPT_ROUNDS: int = 10
+    
+    # Cache
+    REDIS_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: int = 60
+    
+    # Debug
+    DEBUG: bool = False
+    
     # CORS
     FRONTEND_URL: str = "https://dn-blog-wheat.vercel.app"
     
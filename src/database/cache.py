@@ -0,0 +1,150 @@
+import hashlib
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+from fastapi import Request, Response, status
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from src.config.settings import settings
+
+# Caching is disabled when REDIS_URL is not configured
+redis_client = aioredis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+
+POSTS_LIST_KEY = "posts:all"
+
+# Per-key invalidation counters outlive any in-flight response by a wide margin
+GENERATION_TTL_SECONDS = 86400
+
+
+def post_key(post_id: UUID) -> str:
+    """Cache key for a single post"""
+    return f"posts:{post_id}"
+
+
+def user_tag(user_id: UUID) -> str:
+    """Tag grouping every cached entry that embeds a user's profile"""
+    return f"user:{user_id}"
+
+
+def _generation_key(key) -> str:
+    """Counter bumped every time a cache key is invalidated"""
+    if isinstance(key, bytes):
+        key = key.decode()
+    return f"gen:{key}"
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from the values that identify a representation"""
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" identify the same representation
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def cache_headers(etag: str, hit: Optional[bool] = None) -> dict:
+    """HTTP caching headers for a public response"""
+    headers = {
+        "Cache-Control": f"public, max-age={settings.CACHE_TTL_SECONDS}",
+        "ETag": etag,
+    }
+    if hit is not None:
+        headers["X-Cache"] = "HIT" if hit else "MISS"
+    return headers
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 telling the client its copy is still current"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+
+
+def cached_json_response(body: bytes, etag: str, hit: bool) -> Response:
+    """Wrap a pre-serialized JSON body with the caching headers"""
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, hit))
+
+
+async def cache_get(key: str) -> Optional[Tuple[bytes, str]]:
+    """Return the cached (body, etag) pair for a key, or None on a miss"""
+    if redis_client is None:
+        return None
+    try:
+        body, etag = await redis_client.hmget(key, "body", "etag")
+    except RedisError:
+        return None
+    if body is None or etag is None:
+        return None
+    return body, etag.decode()
+
+
+async def cache_generation(key: str) -> Optional[int]:
+    """Current invalidation count for a key, to pass to cache_set later"""
+    if redis_client is None:
+        return None
+    try:
+        return int(await redis_client.get(_generation_key(key)) or 0)
+    except RedisError:
+        return None
+
+
+async def cache_set(
+    key: str,
+    body: bytes,
+    etag: str,
+    tags: Iterable[str] = (),
+    generation: Optional[int] = None,
+) -> None:
+    """Store a serialized response and register it under the given tags
+
+    With `generation` (from cache_generation, read before the data was
+    loaded) the store is skipped if the key was invalidated in the meantime.
+    """
+    if redis_client is None:
+        return
+    ttl = settings.CACHE_TTL_SECONDS
+    try:
+        async with redis_client.pipeline(transaction=generation is not None) as pipe:
+            if generation is not None:
+                # WATCH makes execute() fail if an invalidation lands after this check
+                await pipe.watch(_generation_key(key))
+                if int(await pipe.get(_generation_key(key)) or 0) != generation:
+                    return
+                pipe.multi()
+            pipe.hset(key, mapping={"body": body, "etag": etag})
+            pipe.expire(key, ttl)
+            for tag in tags:
+                pipe.sadd(f"tag:{tag}", key)
+                pipe.expire(f"tag:{tag}", ttl)
+            await pipe.execute()
+    except RedisError:
+        # Includes WatchError: the entry was invalidated, so nothing is stored
+        pass
+
+
+async def cache_invalidate(*keys: str, tags: Iterable[str] = ()) -> None:
+    """Drop cached entries by key and every entry registered under the tags"""
+    if redis_client is None:
+        return
+    try:
+        entries = list(keys)
+        tag_sets = []
+        for tag in tags:
+            entries.extend(await redis_client.smembers(f"tag:{tag}"))
+            tag_sets.append(f"tag:{tag}")
+        if not entries and not tag_sets:
+            return
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete(*entries, *tag_sets)
+            for entry in entries:
+                pipe.incr(_generation_key(entry))
+                pipe.expire(_generation_key(entry), GENERATION_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError:
+        pass
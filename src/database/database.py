@@ -1,18 +1,40 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import raiseload
 from src.config.settings import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _async_database_url(url: str) -> str:
+    """Point a plain PostgreSQL URL at the asyncpg driver"""
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Each worker process holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections,
+# so keep workers * (pool size + overflow) below Postgres max_connections.
+engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """Dependency for database sessions"""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def list_loader_options(*options):
+    """Loader options for list queries; in DEBUG any unplanned lazy load raises"""
+    if settings.DEBUG:
+        return (*options, raiseload("*"))
+    return options
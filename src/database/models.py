@@ -1,18 +1,27 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql import func
 from src.database.database import Base
+from uuid_utils.compat import uuid7
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid7)
     email = Column(String, unique=True, index=True, nullable=False)
     password = Column(String, nullable=False)
     name = Column(String, nullable=False)
     profile_picture = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on profile edits; feeds the post list ETag, which embeds author fields
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Case-insensitive email lookups for login/register
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+    )
 
     # Relationships
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
@@ -22,14 +31,19 @@ class User(Base):
 class Post(Base):
     __tablename__ = "posts"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid7)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     excerpt = Column(String, nullable=True)
     category = Column(String, nullable=True)
-    author_id = Column(String, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    author_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_posts_created_at", created_at.desc()),
+        Index("ix_posts_author_created", author_id, created_at.desc()),
+    )
 
     # Relationships
     author = relationship("User", back_populates="posts")
@@ -39,12 +53,16 @@ class Post(Base):
 class Comment(Base):
     __tablename__ = "comments"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid7)
     content = Column(Text, nullable=False)
-    post_id = Column(String, ForeignKey("posts.id"), nullable=False)
-    author_id = Column(String, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    post_id = Column(UUID(as_uuid=True), ForeignKey("posts.id"), nullable=False)
+    author_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_comments_post_created", post_id, created_at.desc()),
+    )
 
     # Relationships
     post = relationship("Post", back_populates="comments")
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
+from uuid import UUID
 
 
 # User Schemas
@@ -19,12 +20,11 @@ class UserLogin(BaseModel):
 
 
 class UserResponse(UserBase):
-    id: str
+    id: UUID
     profile_picture: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserUpdate(BaseModel):
@@ -63,15 +63,28 @@ class PostUpdate(BaseModel):
 
 
 class PostResponse(PostBase):
-    id: str
-    author_id: str
+    id: UUID
+    author_id: UUID
     author_name: str
     author_profile_picture: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostListItem(BaseModel):
+    id: UUID
+    title: str
+    excerpt: Optional[str] = None
+    category: Optional[str] = None
+    author_id: UUID
+    author_name: str
+    author_profile_picture: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Comment Schemas
@@ -88,16 +101,15 @@ class CommentUpdate(BaseModel):
 
 
 class CommentResponse(CommentBase):
-    id: str
-    post_id: str
-    author_id: str
+    id: UUID
+    post_id: UUID
+    author_id: UUID
     author_name: str
     author_profile_picture: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Generic Response Schemas
@@ -1,9 +1,17 @@
 import bcrypt
+import hashlib
+import time
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
 from src.config.settings import settings
 
+# Decoded token subjects keyed by token digest, so repeat requests skip the
+# signature check; entries never outlive the token's own expiry
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -17,7 +25,7 @@ def get_password_hash(password: str) -> str:
     """Hash a password"""
     # Truncate password to 72 bytes for bcrypt compatibility
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
@@ -35,13 +43,27 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[str]:
+def verify_token(token: str) -> Optional[UUID]:
     """Verify a JWT token and return the user_id"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > time.time():
+            return user_id
+        _token_cache.pop(key, None)
+        return None
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        subject: str = payload.get("sub")
+        if subject is None:
             return None
-        return user_id
-    except JWTError:
+        user_id = UUID(subject)
+    except (JWTError, ValueError):
         return None
+    
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        _token_cache[key] = (user_id, expires_at)
+    return user_id
@@ -1,16 +1,78 @@
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ValidationError
+from typing import Type, TypeVar
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.database import get_db
 from src.database.models import User
 from src.middleware.auth import verify_token
 
 security = HTTPBearer()
 
+# Detached User rows by id; each request merges a copy into its own session.
+# Kept short-lived because other workers' profile updates are not seen here.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_body(model: Type[ModelT]):
+    """Dependency that validates the raw request body straight into `model`
+
+    model_validate_json parses the bytes in pydantic-core, skipping the
+    intermediate dict FastAPI builds for regular body parameters.
+    """
+    async def parse_body(request: Request) -> ModelT:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+            )
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [_body_error(error) for error in exc.errors(include_url=False)]
+            )
+    
+    return parse_body
+
+
+def _body_error(error: dict) -> dict:
+    """Reshape a pydantic error the way FastAPI reports request body errors"""
+    if error["type"] == "json_invalid":
+        # pydantic puts the raw bytes in "input", which is not JSON-encodable
+        return {
+            "type": "json_invalid",
+            "loc": ("body", 0),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": error.get("ctx", {}).get("error", error["msg"])},
+        }
+    return {**error, "loc": ("body", *error["loc"])}
+
+
+def forget_cached_user(user_id: UUID) -> None:
+    """Drop a user from the authentication cache after their row changes"""
+    _user_cache.pop(user_id, None)
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """OpenAPI request body for routes that read their payload via json_body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get the current authenticated user"""
     token = credentials.credentials
@@ -23,7 +85,11 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    cached_user = _user_cache.get(user_id)
+    if cached_user is not None:
+        return await db.merge(cached_user, load=False)
+    
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,12 +97,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    # Cache a detached instance so later edits to this session's copy never leak into it
+    db.expunge(user)
+    _user_cache[user_id] = user
+    return await db.merge(user, load=False)
 
 
 async def get_current_user_optional(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User | None:
     """Get the current authenticated user if token is provided, otherwise None"""
     try:
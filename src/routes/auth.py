@@ -1,16 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.database import get_db
 from src.database.models import User
 from src.database.schemas import UserCreate, UserLogin, Token, UserResponse, MessageResponse
 from src.middleware.auth import verify_password, get_password_hash, create_access_token
-import uuid
+from src.middleware.dependencies import json_body, json_body_openapi
+from uuid_utils.compat import uuid7
+import anyio
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-@router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/register",
+    response_model=Token,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UserCreate)
+)
+async def register(
+    user_data: UserCreate = Depends(json_body(UserCreate)),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Register a new user
     
@@ -18,37 +30,39 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     - **password**: Password (minimum 6 characters)
     - **name**: User's full name
     """
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+    user_id = uuid7()
+    # bcrypt is CPU-bound; hash in a worker thread to keep the event loop free
+    hashed_password = await anyio.to_thread.run_sync(get_password_hash, user_data.password)
+    
+    # Insert unless the email is taken; a single statement is race-free under
+    # concurrent signups and saves the separate existence check
+    stmt = (
+        insert(User)
+        .values(
+            id=user_id,
+            email=user_data.email,
+            password=hashed_password,
+            name=user_data.name
+        )
+        .on_conflict_do_nothing()
+        .returning(User.id, User.created_at)
+    )
+    new_user = (await db.execute(stmt)).first()
+    if new_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Create new user
-    user_id = str(uuid.uuid4())
-    hashed_password = get_password_hash(user_data.password)
-    
-    new_user = User(
-        id=user_id,
-        email=user_data.email,
-        password=hashed_password,
-        name=user_data.name
-    )
-    
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
     
     # Create access token
-    access_token = create_access_token(data={"sub": new_user.id})
+    access_token = create_access_token(data={"sub": str(new_user.id)})
     
-    user_response = UserResponse(
+    user_response = UserResponse.model_construct(
         id=new_user.id,
-        email=new_user.email,
-        name=new_user.name,
-        profile_picture=new_user.profile_picture,
+        email=user_data.email,
+        name=user_data.name,
+        profile_picture=None,
         created_at=new_user.created_at
     )
     
@@ -56,18 +70,22 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     Login with email and password
     
     - **email**: User's email address
     - **password**: User's password
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
+    # Fetch only what the credential check needs; the full row is loaded on success
+    auth_row = (
+        await db.execute(
+            select(User.id, User.password).where(func.lower(User.email) == credentials.email.lower())
+        )
+    ).first()
     
     # Check if user exists
-    if not user:
+    if not auth_row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email: No account found with this email address",
@@ -75,17 +93,20 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
         )
     
     # Verify password
-    if not verify_password(credentials.password, user.password):
+    password_valid = await anyio.to_thread.run_sync(verify_password, credentials.password, auth_row.password)
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password: Password is incorrect",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    user = await db.get(User, auth_row.id)
+    
     # Create access token
-    access_token = create_access_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": str(user.id)})
     
-    user_response = UserResponse(
+    user_response = UserResponse.model_construct(
         id=user.id,
         email=user.email,
         name=user.name,
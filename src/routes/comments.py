@@ -1,22 +1,45 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
-from src.database.database import get_db
+from src.database.database import get_db, list_loader_options
 from src.database.models import User, Post, Comment
 from src.database.schemas import CommentCreate, CommentUpdate, CommentResponse, MessageResponse
-from src.middleware.dependencies import get_current_user
+from src.middleware.dependencies import get_current_user, json_body, json_body_openapi
 import uuid
-from datetime import datetime
+from uuid_utils.compat import uuid7
 
 router = APIRouter(tags=["Comments"])
 
 
-@router.post("/posts/{post_id}/comments", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+async def raise_comment_not_owned(db: AsyncSession, comment_id: uuid.UUID, action: str):
+    """Explain why an ownership-scoped write matched no rows: 404 or 403"""
+    author_id = (
+        await db.execute(select(Comment.author_id).where(Comment.id == comment_id))
+    ).scalar_one_or_none()
+    if author_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Unauthorized access - only the author can {action} this comment"
+    )
+
+
+@router.post(
+    "/posts/{post_id}/comments",
+    response_model=CommentResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(CommentCreate)
+)
 async def create_comment(
-    post_id: str,
-    comment_data: CommentCreate,
+    post_id: uuid.UUID,
+    comment_data: CommentCreate = Depends(json_body(CommentCreate)),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Add a comment to a post
@@ -25,31 +48,34 @@ async def create_comment(
     - **content**: Comment content (required)
     """
     # Check if post exists
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    comment_id = str(uuid.uuid4())
+    comment_id = uuid7()
+    
+    # RETURNING hands back the server-generated timestamps, so no refresh is needed
+    stmt = (
+        insert(Comment)
+        .values(
+            id=comment_id,
+            content=comment_data.content,
+            post_id=post_id,
+            author_id=current_user.id
+        )
+        .returning(Comment.created_at, Comment.updated_at)
+    )
+    new_comment = (await db.execute(stmt)).one()
+    await db.commit()
     
-    new_comment = Comment(
+    return CommentResponse.model_construct(
         id=comment_id,
         content=comment_data.content,
         post_id=post_id,
-        author_id=current_user.id
-    )
-    
-    db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
-    
-    return CommentResponse(
-        id=new_comment.id,
-        content=new_comment.content,
-        post_id=new_comment.post_id,
-        author_id=new_comment.author_id,
+        author_id=current_user.id,
         author_name=current_user.name,
         author_profile_picture=current_user.profile_picture,
         created_at=new_comment.created_at,
@@ -58,24 +84,30 @@ async def create_comment(
 
 
 @router.get("/posts/{post_id}/comments", response_model=List[CommentResponse])
-async def get_comments_by_post(post_id: str, db: Session = Depends(get_db)):
+async def get_comments_by_post(post_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """
     Get all comments for a specific post
     
     - **post_id**: The ID of the post
     """
     # Check if post exists
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.desc()).all()
+    result = await db.execute(
+        select(Comment)
+        .options(*list_loader_options(selectinload(Comment.author)))
+        .where(Comment.post_id == post_id)
+        .order_by(Comment.created_at.desc())
+    )
+    comments = result.scalars().all()
     
     return [
-        CommentResponse(
+        CommentResponse.model_construct(
             id=comment.id,
             content=comment.content,
             post_id=comment.post_id,
@@ -91,10 +123,10 @@ async def get_comments_by_post(post_id: str, db: Session = Depends(get_db)):
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
 async def update_comment(
-    comment_id: str,
+    comment_id: uuid.UUID,
     comment_data: CommentUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Edit a comment (only the author can edit)
@@ -102,34 +134,27 @@ async def update_comment(
     - **comment_id**: The ID of the comment to update
     - **content**: New comment content
     """
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
-    
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Comment not found"
-        )
-    
-    # Check if user is the author
-    if comment.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Unauthorized access - only the author can edit this comment"
-        )
-    
-    comment.content = comment_data.content
-    comment.updated_at = datetime.utcnow()
+    # The ownership check is part of the WHERE clause, so the update is one
+    # atomic statement; only a miss costs a second query to pick 404 or 403
+    stmt = (
+        update(Comment)
+        .where(Comment.id == comment_id, Comment.author_id == current_user.id)
+        .values(content=comment_data.content, updated_at=func.now())
+        .returning(Comment)
+    )
+    comment = (await db.execute(stmt)).scalar_one_or_none()
+    if comment is None:
+        await raise_comment_not_owned(db, comment_id, "edit")
     
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
     
-    return CommentResponse(
+    return CommentResponse.model_construct(
         id=comment.id,
         content=comment.content,
         post_id=comment.post_id,
         author_id=comment.author_id,
-        author_name=comment.author.name,
-        author_profile_picture=comment.author.profile_picture,
+        author_name=current_user.name,
+        author_profile_picture=current_user.profile_picture,
         created_at=comment.created_at,
         updated_at=comment.updated_at
     )
@@ -137,31 +162,23 @@ async def update_comment(
 
 @router.delete("/comments/{comment_id}", response_model=MessageResponse)
 async def delete_comment(
-    comment_id: str,
+    comment_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a comment (only the author can delete)
     
     - **comment_id**: The ID of the comment to delete
     """
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
-    
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Comment not found"
-        )
-    
-    # Check if user is the author
-    if comment.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Unauthorized access - only the author can delete this comment"
-        )
+    result = await db.execute(
+        delete(Comment)
+        .where(Comment.id == comment_id, Comment.author_id == current_user.id)
+        .returning(Comment.id)
+    )
+    if result.scalar_one_or_none() is None:
+        await raise_comment_not_owned(db, comment_id, "delete")
     
-    db.delete(comment)
-    db.commit()
+    await db.commit()
     
     return MessageResponse(message="Comment successfully deleted")
@@ -1,21 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
-from src.database.database import get_db
-from src.database.models import User, Post
-from src.database.schemas import PostCreate, PostUpdate, PostResponse, MessageResponse
-from src.middleware.dependencies import get_current_user
+from src.database.database import get_db, SessionLocal
+from src.database.cache import (
+    POSTS_LIST_KEY, post_key, user_tag, make_etag, etag_matches,
+    cache_headers, not_modified_response, cached_json_response,
+    cache_get, cache_generation, cache_set, cache_invalidate
+)
+from src.database.models import User, Post, Comment
+from src.database.schemas import PostCreate, PostUpdate, PostResponse, PostListItem, MessageResponse
+from src.middleware.dependencies import get_current_user, json_body, json_body_openapi
+import orjson
 import uuid
-from datetime import datetime
+from uuid_utils.compat import uuid7
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
+# Rows fetched per round-trip while streaming GET /posts
+POSTS_STREAM_BATCH_SIZE = 200
 
-@router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
+
+def serialize_post_list_row(row) -> bytes:
+    """Encode one `PostListItem`-shaped row straight to JSON"""
+    # asyncpg returns its own uuid.UUID subclass, which orjson refuses
+    return orjson.dumps(
+        {
+            "id": str(row.id),
+            "title": row.title,
+            "excerpt": row.excerpt,
+            "category": row.category,
+            "author_id": str(row.author_id),
+            "author_name": row.name,
+            "author_profile_picture": row.profile_picture,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+        },
+        option=orjson.OPT_UTC_Z,
+    )
+
+
+async def encode_post_list(rows):
+    """Yield a JSON array of post list rows chunk by chunk"""
+    separator = b""
+    yield b"["
+    async for row in rows:
+        yield separator + serialize_post_list_row(row)
+        separator = b","
+    yield b"]"
+
+
+async def raise_post_not_owned(db: AsyncSession, post_id: uuid.UUID, action: str):
+    """Explain why an ownership-scoped write matched no rows: 404 or 403"""
+    author_id = (await db.execute(select(Post.author_id).where(Post.id == post_id))).scalar_one_or_none()
+    if author_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Unauthorized access - only the author can {action} this post"
+    )
+
+
+@router.post(
+    "",
+    response_model=PostResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(PostCreate)
+)
 async def create_post(
-    post_data: PostCreate,
+    post_data: PostCreate = Depends(json_body(PostCreate)),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new blog post
@@ -25,28 +85,25 @@ async def create_post(
     - **excerpt**: Short excerpt or summary (optional)
     - **category**: Post category (optional)
     """
-    post_id = str(uuid.uuid4())
+    post_id = uuid7()
+    
+    # RETURNING hands back the server-generated timestamps, so no refresh is needed
+    stmt = (
+        insert(Post)
+        .values(id=post_id, author_id=current_user.id, **post_data.model_dump())
+        .returning(Post.created_at, Post.updated_at)
+    )
+    new_post = (await db.execute(stmt)).one()
+    await db.commit()
+    await cache_invalidate(POSTS_LIST_KEY)
     
-    new_post = Post(
+    return PostResponse.model_construct(
         id=post_id,
         title=post_data.title,
         content=post_data.content,
         excerpt=post_data.excerpt,
         category=post_data.category,
-        author_id=current_user.id
-    )
-    
-    db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
-    
-    return PostResponse(
-        id=new_post.id,
-        title=new_post.title,
-        content=new_post.content,
-        excerpt=new_post.excerpt,
-        category=new_post.category,
-        author_id=new_post.author_id,
+        author_id=current_user.id,
         author_name=current_user.name,
         author_profile_picture=current_user.profile_picture,
         created_at=new_post.created_at,
@@ -54,40 +111,98 @@ async def create_post(
     )
 
 
-@router.get("", response_model=List[PostResponse])
-async def get_all_posts(db: Session = Depends(get_db)):
+@router.get("", response_model=List[PostListItem])
+async def get_all_posts(request: Request, db: AsyncSession = Depends(get_db)):
     """
     Retrieve all blog posts
     
-    Returns a list of all posts ordered by creation date (newest first)
+    Returns a list of all posts ordered by creation date (newest first).
+    The full `content` is omitted; fetch a single post to read it.
     """
-    posts = db.query(Post).order_by(Post.created_at.desc()).all()
-    
-    return [
-        PostResponse(
-            id=post.id,
-            title=post.title,
-            content=post.content,
-            excerpt=post.excerpt,
-            category=post.category,
-            author_id=post.author_id,
-            author_name=post.author.name,
-            author_profile_picture=post.author.profile_picture,
-            created_at=post.created_at,
-            updated_at=post.updated_at
+    cached = await cache_get(POSTS_LIST_KEY)
+    if cached is not None:
+        body, etag = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return cached_json_response(body, etag, hit=True)
+    
+    # Read before loading anything, so a write during the stream stops the
+    # now-stale body from being cached; None means caching is unavailable
+    generation = await cache_generation(POSTS_LIST_KEY)
+    
+    # The aggregate identifies the list version, so a conditional request is
+    # answered without loading the list and the ETag can be sent up front.
+    # Authors' updated_at is included because list items embed their profile.
+    latest, count, latest_author = (
+        await db.execute(
+            select(func.max(Post.updated_at), func.count(Post.id), func.max(User.updated_at))
+            .select_from(Post)
+            .join(User, User.id == Post.author_id)
+        )
+    ).one()
+    etag = make_etag(latest, count, latest_author)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    
+    stmt = (
+        select(
+            Post.id,
+            Post.title,
+            Post.excerpt,
+            Post.category,
+            Post.author_id,
+            Post.created_at,
+            Post.updated_at,
+            User.name,
+            User.profile_picture,
         )
-        for post in posts
-    ]
+        .join(User, User.id == Post.author_id)
+        .order_by(Post.created_at.desc())
+        .execution_options(yield_per=POSTS_STREAM_BATCH_SIZE)
+    )
+    
+    # Hand the request's connection back before streaming: FastAPI only closes
+    # the dependency session after the response ends, and the stream below
+    # needs a connection of its own
+    await db.close()
+    
+    async def body_chunks():
+        # The stream owns its session rather than relying on when FastAPI
+        # closes the request's dependencies. Rows are encoded as they arrive,
+        # but while caching is available the whole body is also collected in
+        # memory so it can be stored once the stream completes.
+        parts = []
+        async with SessionLocal() as session:
+            result = await session.stream(stmt)
+            async for chunk in encode_post_list(result):
+                if generation is not None:
+                    parts.append(chunk)
+                yield chunk
+        if generation is not None:
+            await cache_set(POSTS_LIST_KEY, b"".join(parts), etag, generation=generation)
+    
+    return StreamingResponse(body_chunks(), media_type="application/json", headers=cache_headers(etag, hit=False))
 
 
 @router.get("/{post_id}", response_model=PostResponse)
-async def get_post_by_id(post_id: str, db: Session = Depends(get_db)):
+async def get_post_by_id(post_id: uuid.UUID, request: Request, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific post by ID
     
     - **post_id**: The ID of the post to retrieve
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    key = post_key(post_id)
+    cached = await cache_get(key)
+    if cached is not None:
+        body, etag = cached
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        return cached_json_response(body, etag, hit=True)
+    
+    # Read before the fetch so an edit racing this request cannot be cached stale
+    generation = await cache_generation(key)
+    
+    post = await db.get(Post, post_id, options=[selectinload(Post.author)])
     
     if not post:
         raise HTTPException(
@@ -95,7 +210,11 @@ async def get_post_by_id(post_id: str, db: Session = Depends(get_db)):
             detail="Post not found"
         )
     
-    return PostResponse(
+    etag = make_etag(post.id, post.updated_at, post.author.name, post.author.profile_picture)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    
+    post_response = PostResponse.model_construct(
         id=post.id,
         title=post.title,
         content=post.content,
@@ -107,14 +226,19 @@ async def get_post_by_id(post_id: str, db: Session = Depends(get_db)):
         created_at=post.created_at,
         updated_at=post.updated_at
     )
+    
+    body = post_response.model_dump_json().encode()
+    await cache_set(key, body, etag, tags=[user_tag(post.author_id)], generation=generation)
+    
+    return cached_json_response(body, etag, hit=False)
 
 
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
-    post_id: str,
+    post_id: uuid.UUID,
     post_data: PostUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Edit an existing post (only the author can edit)
@@ -125,45 +249,30 @@ async def update_post(
     - **excerpt**: New excerpt (optional)
     - **category**: New category (optional)
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
-    
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
-    
-    # Check if user is the author
-    if post.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Unauthorized access - only the author can edit this post"
-        )
-    
-    # Update fields
-    if post_data.title is not None:
-        post.title = post_data.title
-    if post_data.content is not None:
-        post.content = post_data.content
-    if post_data.excerpt is not None:
-        post.excerpt = post_data.excerpt
-    if post_data.category is not None:
-        post.category = post_data.category
-    
-    post.updated_at = datetime.utcnow()
+    # The ownership check is part of the WHERE clause, so the update is one
+    # atomic statement; only a miss costs a second query to pick 404 or 403
+    stmt = (
+        update(Post)
+        .where(Post.id == post_id, Post.author_id == current_user.id)
+        .values(**post_data.model_dump(exclude_none=True), updated_at=func.now())
+        .returning(Post)
+    )
+    post = (await db.execute(stmt)).scalar_one_or_none()
+    if post is None:
+        await raise_post_not_owned(db, post_id, "edit")
     
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await cache_invalidate(POSTS_LIST_KEY, post_key(post_id))
     
-    return PostResponse(
+    return PostResponse.model_construct(
         id=post.id,
         title=post.title,
         content=post.content,
         excerpt=post.excerpt,
         category=post.category,
         author_id=post.author_id,
-        author_name=post.author.name,
-        author_profile_picture=post.author.profile_picture,
+        author_name=current_user.name,
+        author_profile_picture=current_user.profile_picture,
         created_at=post.created_at,
         updated_at=post.updated_at
     )
@@ -171,31 +280,29 @@ async def update_post(
 
 @router.delete("/{post_id}", response_model=MessageResponse)
 async def delete_post(
-    post_id: str,
+    post_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a post (only the author can delete)
     
     - **post_id**: The ID of the post to delete
     """
-    post = db.query(Post).filter(Post.id == post_id).first()
+    owned_post = select(Post.id).where(Post.id == post_id, Post.author_id == current_user.id)
     
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Post not found"
-        )
-    
-    # Check if user is the author
-    if post.author_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Unauthorized access - only the author can delete this post"
-        )
+    # Comments go first (the foreign key has no ON DELETE CASCADE); both
+    # statements are scoped to posts the user owns
+    await db.execute(delete(Comment).where(Comment.post_id.in_(owned_post)))
+    result = await db.execute(
+        delete(Post)
+        .where(Post.id == post_id, Post.author_id == current_user.id)
+        .returning(Post.id)
+    )
+    if result.scalar_one_or_none() is None:
+        await raise_post_not_owned(db, post_id, "delete")
     
-    db.delete(post)
-    db.commit()
+    await db.commit()
+    await cache_invalidate(POSTS_LIST_KEY, post_key(post_id))
     
     return MessageResponse(message="Post successfully deleted")
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from src.database.database import get_db
+from src.database.database import get_db, list_loader_options
+from src.database.cache import POSTS_LIST_KEY, user_tag, cache_invalidate
 from src.database.models import User, Post
 from src.database.schemas import UserResponse, PostResponse, UserUpdate
-from src.middleware.dependencies import get_current_user
+from src.middleware.dependencies import get_current_user, forget_cached_user
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -14,7 +16,7 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
     """
     Get the current user's profile
     """
-    return UserResponse(
+    return UserResponse.model_construct(
         id=current_user.id,
         email=current_user.email,
         name=current_user.name,
@@ -27,7 +29,7 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
 async def update_user_profile(
     user_data: UserUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update the current user's profile
@@ -40,10 +42,13 @@ async def update_user_profile(
     if user_data.profile_picture is not None:
         current_user.profile_picture = user_data.profile_picture
     
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    forget_cached_user(current_user.id)
+    # Cached posts embed the author's name and picture
+    await cache_invalidate(POSTS_LIST_KEY, tags=[user_tag(current_user.id)])
     
-    return UserResponse(
+    return UserResponse.model_construct(
         id=current_user.id,
         email=current_user.email,
         name=current_user.name,
@@ -55,15 +60,21 @@ async def update_user_profile(
 @router.get("/me/posts", response_model=List[PostResponse])
 async def get_user_posts(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all posts created by the current user
     """
-    posts = db.query(Post).filter(Post.author_id == current_user.id).order_by(Post.created_at.desc()).all()
+    result = await db.execute(
+        select(Post)
+        .options(*list_loader_options())
+        .where(Post.author_id == current_user.id)
+        .order_by(Post.created_at.desc())
+    )
+    posts = result.scalars().all()
     
     return [
-        PostResponse(
+        PostResponse.model_construct(
             id=post.id,
             title=post.title,
             content=post.content,
@@ -71,6 +82,7 @@ async def get_user_posts(
             category=post.category,
             author_id=post.author_id,
             author_name=current_user.name,
+            author_profile_picture=current_user.profile_picture,
             created_at=post.created_at,
             updated_at=post.updated_at
         )
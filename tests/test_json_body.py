@@ -0,0 +1,37 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/auth/register", "/posts"])
+@pytest.mark.parametrize("body", [b"not json", b"{bad"])
+def test_malformed_json_returns_422(path, body):
+    response = client.post(path, content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 0]
+    assert error["input"] == {}
+
+
+@pytest.mark.parametrize("path", ["/auth/register", "/posts"])
+def test_empty_body_returns_422(path):
+    response = client.post(path, content=b"", headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 422
+    [error] = response.json()["detail"]
+    assert error["type"] == "missing"
+    assert error["loc"] == ["body"]
+
+
+def test_schema_invalid_body_returns_422_with_body_locations():
+    response = client.post("/auth/register", json={"email": "jane@example.com", "password": "123"})
+
+    assert response.status_code == 422
+    errors = {tuple(error["loc"]): error for error in response.json()["detail"]}
+    assert errors[("body", "password")]["type"] == "string_too_short"
+    assert errors[("body", "name")]["type"] == "missing"
+    assert all("url" not in error for error in errors.values())
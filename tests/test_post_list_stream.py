@@ -0,0 +1,52 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from src.routes.posts import encode_post_list
+
+
+class DriverUUID(uuid.UUID):
+    """Stands in for asyncpg's uuid.UUID subclass, which orjson rejects"""
+
+
+def make_row(title):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=DriverUUID(str(uuid.uuid4())),
+        title=title,
+        excerpt=None,
+        category="news",
+        author_id=DriverUUID(str(uuid.uuid4())),
+        name="Jane",
+        profile_picture=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def as_stream(rows):
+    for row in rows:
+        yield row
+
+
+def collect(rows):
+    async def run():
+        return b"".join([chunk async for chunk in encode_post_list(as_stream(rows))])
+    return asyncio.run(run())
+
+
+def test_streams_non_empty_list_as_json_array():
+    rows = [make_row("First"), make_row("Second")]
+
+    items = json.loads(collect(rows))
+
+    assert [item["title"] for item in items] == ["First", "Second"]
+    assert items[0]["id"] == str(rows[0].id)
+    assert items[0]["author_id"] == str(rows[0].author_id)
+    assert items[0]["author_name"] == "Jane"
+    assert items[0]["created_at"] == "2026-01-01T00:00:00Z"
+
+
+def test_streams_empty_list():
+    assert json.loads(collect([])) == []
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from main import app
+from src.config.settings import settings
+from src.database.database import Base, _async_database_url, get_db
+from src.database.models import Comment, Post, User
+from src.middleware.dependencies import get_current_user
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set; the tables are dropped afterwards"
+)
+
+
+class QueryCounter:
+    """Counts statements sent to the database through an engine"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    # NullPool: the fixture and TestClient run on different event loops
+    engine = create_async_engine(_async_database_url(TEST_DATABASE_URL), poolclass=NullPool)
+    sessions = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with sessions() as db:
+            authors = [
+                User(email=f"author{i}@example.com", password="x", name=f"Author {i}")
+                for i in range(2)
+            ]
+            db.add_all(authors)
+            await db.flush()
+            posts = [
+                Post(title=f"Post {i}", content="Body", author_id=authors[0].id)
+                for i in range(3)
+            ]
+            db.add_all(posts)
+            await db.flush()
+            db.add_all(
+                Comment(content=f"Comment {i}", post_id=posts[0].id, author_id=authors[i % 2].id)
+                for i in range(4)
+            )
+            await db.commit()
+            return authors[0], posts[0]
+
+    async def teardown():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+    author, post = asyncio.run(setup())
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: author
+    yield author, post, counter
+    app.dependency_overrides.clear()
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    asyncio.run(teardown())
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # DEBUG adds raiseload("*"), so an unplanned lazy load fails the request
+    monkeypatch.setattr(settings, "DEBUG", True)
+    return TestClient(app)
+
+
+def test_comments_by_post_query_count(seeded, client):
+    _, post, counter = seeded
+    counter.count = 0
+
+    response = client.get(f"/posts/{post.id}/comments")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+    # Post existence check, comments, and one selectin for both authors
+    assert counter.count == 3
+
+
+def test_user_posts_query_count(seeded, client):
+    _, _, counter = seeded
+    counter.count = 0
+
+    response = client.get("/users/me/posts")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert counter.count == 1